@@ -1,19 +1,29 @@
+import json
+import math
 import re
 import time
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from . import __version__
 
+try:
+    import orjson
+except ImportError:  # Optional, installed with the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 API_BASE = "https://api.nextdns.io/"
 DEFAULT_RETRIES = 4
 DEFAULT_DELAY = 1  # For general errors or Retry-After scenarios
 DEFAULT_TIMEOUT = 10
 USER_AGENT = f"nextdnsctl/{__version__}"
 DEFAULT_PATIENT_RETRY_PAUSE_SECONDS = 60  # Pause for unspecific 429s
+MAX_RETRY_DELAY = 30  # Upper bound for exponential backoff between retries
+DEFAULT_POOL_MAXSIZE = 20  # Matches the --concurrency ceiling so workers never wait for a socket
 
 # Domain validation regex - matches valid domain names
 # Allows letters, numbers, hyphens, and dots. Must have at least one dot.
@@ -26,6 +36,15 @@ class RateLimitStillActiveError(Exception):
     pass
 
 
+class APIError(Exception):
+    """Raised when the NextDNS API returns an error response."""
+
+    def __init__(self, message: str, status_code: int, detail: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.detail = detail
+
+
 class InvalidDomainError(Exception):
     """Raised when a domain name is invalid."""
 
@@ -40,6 +59,7 @@ def validate_domain(domain: str) -> str:
     - Protocol prefixes (http://, https://, ftp://, etc.)
     - Paths after the domain (/path/to/something)
     - Port numbers (example.com:8080)
+    - Trailing root dots (example.com.)
 
     Args:
         domain: The domain name or URL to validate
@@ -66,6 +86,9 @@ def validate_domain(domain: str) -> str:
     if ":" in domain:
         domain = domain.split(":", 1)[0]
 
+    # Strip the trailing root dot of a fully qualified name (e.g., example.com.)
+    domain = domain.rstrip(".")
+
     if not domain:
         raise InvalidDomainError("Domain cannot be empty")
     if len(domain) > 253:
@@ -75,6 +98,56 @@ def validate_domain(domain: str) -> str:
     return domain
 
 
+def _backoff_delay(delay: float, attempt: int) -> float:
+    """Exponential backoff for the given attempt, capped at MAX_RETRY_DELAY."""
+    return min(delay * (2**attempt), MAX_RETRY_DELAY)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a Retry-After header value into seconds.
+
+    The header may be either a number of seconds or an HTTP date.
+    Returns None if the header is missing or cannot be parsed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0, math.ceil(retry_at.timestamp() - time.time()))
+
+
+def _error_detail(response: requests.Response) -> Optional[str]:
+    """
+    Extract the error detail from an API error response.
+
+    Returns None for empty bodies and bodies declared as non-JSON without
+    attempting to decode them.
+    """
+    content_type = response.headers.get("Content-Type")
+    if not response.content or (content_type and "json" not in content_type):
+        return None
+    try:
+        error_data = response.json()
+    except ValueError:
+        return None
+    errors = error_data.get("errors", [{"detail": "Unknown error"}]) if isinstance(error_data, dict) else None
+    return errors[0].get("detail", "Unknown error") if errors else "Unknown error"
+
+
+def _encode_json(data: Any) -> bytes:
+    """Serialize a request payload to compact JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
 class APIClient:
     """
     NextDNS API client with connection pooling and retry logic.
@@ -89,6 +162,7 @@ class APIClient:
         retries: int = DEFAULT_RETRIES,
         delay: float = DEFAULT_DELAY,
         timeout: float = DEFAULT_TIMEOUT,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
     ):
         """
         Initialize the API client.
@@ -98,6 +172,7 @@ class APIClient:
             retries: Number of retry attempts for failed requests
             delay: Initial delay between retries (exponential backoff)
             timeout: Request timeout in seconds
+            pool_maxsize: Maximum number of pooled connections kept alive
         """
         self.api_key = api_key
         self.retries = retries
@@ -112,32 +187,62 @@ class APIClient:
                 "User-Agent": USER_AGENT,
             }
         )
+        # The default pool keeps only 10 connections; size it so parallel
+        # workers reuse sockets instead of discarding and reconnecting
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=pool_maxsize))
+
+        # ETag and body of the last successful GET per URL, used to
+        # revalidate with If-None-Match instead of re-downloading. The same
+        # body object is handed out on every hit, so it must not be modified.
+        self.etag_cache: Dict[str, Tuple[str, Any]] = {}
 
     def call(
         self,
         method: str,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
         retries: Optional[int] = None,
         delay: Optional[float] = None,
         timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Make an API request to NextDNS."""
+        """
+        Make an API request to NextDNS.
+
+        Bodies returned for GET requests are shared with the ETag cache and
+        returned again on 304 Not Modified, so callers must not modify them.
+        """
         retries = retries if retries is not None else self.retries
         delay = delay if delay is not None else self.delay
         timeout = timeout if timeout is not None else self.timeout
 
-        url = urljoin(API_BASE, endpoint.lstrip("/"))
+        # Endpoints are always relative to API_BASE, so plain concatenation
+        # gives the same URL as urljoin without parsing it on every call
+        url = API_BASE + endpoint.lstrip("/")
+
+        # Encode the payload once so retries don't serialize it again
+        headers: Dict[str, str] = {}
+        payload = None
+        if data is not None:
+            payload = _encode_json(data)
+            headers["Content-Type"] = "application/json"
+
+        cached = self.etag_cache.get(url) if method == "GET" else None
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
 
         for attempt in range(retries + 1):
             try:
-                response = self.session.request(method, url, json=data, timeout=timeout)
+                response = self.session.request(method, url, data=payload, timeout=timeout, headers=headers)
+
+                if response.status_code == 304 and cached is not None:
+                    return cached[1]
 
                 if response.status_code == 429:
                     retry_after_header = response.headers.get("Retry-After")
+                    retry_after = _parse_retry_after(retry_after_header)
                     if attempt < retries:
-                        if retry_after_header:
-                            sleep_time = int(retry_after_header)
+                        if retry_after is not None:
+                            sleep_time = retry_after
                             print(
                                 f"Rate limited by API (Retry-After: {sleep_time}s). "
                                 f"Retrying attempt {attempt + 1}/{retries + 1}..."
@@ -151,22 +256,23 @@ class APIClient:
                         time.sleep(sleep_time)
                         continue
                     else:
-                        if not retry_after_header:
+                        if retry_after is None:
                             raise RateLimitStillActiveError(
                                 "API rate limit still active after "
                                 f"{retries + 1} attempts"
                                 " and significant pauses."
                             )
                         else:
-                            raise Exception(
+                            raise APIError(
                                 "API rate limit exceeded after "
                                 f"{retries + 1} attempts (Retry-After was "
-                                f"{retry_after_header}s on last attempt)."
+                                f"{retry_after_header}s on last attempt).",
+                                429,
                             )
 
                 if response.status_code not in (200, 201, 204):
                     if response.status_code >= 500 and attempt < retries:
-                        current_delay = delay * (2**attempt)
+                        current_delay = _backoff_delay(delay, attempt)
                         print(
                             f"Server error ({response.status_code}). Retrying in {current_delay}s "
                             f"(attempt {attempt + 1}/{retries + 1})..."
@@ -174,23 +280,24 @@ class APIClient:
                         time.sleep(current_delay)
                         continue
 
-                    try:
-                        error_data = response.json()
-                        errors = error_data.get("errors", [{"detail": "Unknown error"}])
-                        detail = errors[0].get("detail", "Unknown error") if errors else "Unknown error"
-                        raise Exception(f"API error: {detail} (Status: {response.status_code})")
-                    except ValueError:
-                        raise Exception(
-                            f"API request failed with status {response.status_code} " f"and non-JSON response."
-                        )
+                    status = response.status_code
+                    detail = _error_detail(response)
+                    if detail is None:
+                        raise APIError(f"API request failed with status {status} and non-JSON response.", status)
+                    raise APIError(f"API error: {detail} (Status: {status})", status, detail)
 
                 if response.status_code == 204:
                     return None
-                return response.json()
+                result = response.json()
+                if method == "GET":
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self.etag_cache[url] = (etag, result)
+                return result
 
             except RequestException as e:
                 if attempt < retries:
-                    current_delay = delay * (2**attempt)
+                    current_delay = _backoff_delay(delay, attempt)
                     print(
                         f"Network error ({e}). Retrying in {current_delay}s "
                         f"(attempt {attempt + 1}/{retries + 1})..."
@@ -202,6 +309,20 @@ class APIClient:
 
         raise Exception(f"API call failed after {retries + 1} attempts for an unknown reason.")
 
+    def get_etag(self, endpoint: str) -> Optional[str]:
+        """Return the ETag of the last successful GET of an endpoint, if any."""
+        cached = self.etag_cache.get(API_BASE + endpoint.lstrip("/"))
+        return cached[0] if cached is not None else None
+
+    def prime_etag(self, endpoint: str, etag: str, body: Any) -> None:
+        """
+        Seed the ETag cache for an endpoint, e.g. from a previous process.
+
+        The next GET of the endpoint sends If-None-Match and returns body if
+        the server answers 304 Not Modified.
+        """
+        self.etag_cache[API_BASE + endpoint.lstrip("/")] = (etag, body)
+
     def close(self) -> None:
         """Close the session and release resources."""
         self.session.close()
@@ -215,14 +336,18 @@ class APIClient:
     # High-level API methods
 
     def get_profiles(self) -> List[Dict[str, Any]]:
-        """Retrieve all NextDNS profiles."""
+        """Retrieve all NextDNS profiles. The returned list is cached and must not be modified."""
         response = self.call("GET", "profiles")
         if response is None:
             raise Exception("Unexpected empty response from profiles endpoint")
         return response["data"]
 
     def get_domain_list(self, profile_id: str, list_type: str) -> List[Dict[str, Any]]:
-        """Retrieve the current list (denylist/allowlist) for a profile."""
+        """
+        Retrieve the current list (denylist/allowlist) for a profile.
+
+        The returned list is cached for ETag revalidation and must not be modified.
+        """
         response = self.call("GET", f"profiles/{profile_id}/{list_type}")
         if response is None:
             raise Exception(f"Unexpected empty response from {list_type} endpoint")
@@ -245,6 +370,22 @@ class APIClient:
         self.call("DELETE", f"profiles/{profile_id}/{list_type}/{domain}")
         return f"Removed {domain}"
 
+    def replace_domain_list(
+        self,
+        profile_id: str,
+        list_type: str,
+        entries: List[Dict[str, Any]],
+    ) -> str:
+        """
+        Replace the whole list (denylist/allowlist) in a single request.
+
+        Each entry is a dict with "id" and "active" keys. Domains missing from
+        entries are removed from the list.
+        """
+        data = [{"id": entry["id"], "active": entry.get("active", True)} for entry in entries]
+        self.call("PUT", f"profiles/{profile_id}/{list_type}", data=data)
+        return f"Replaced {list_type} with {len(data)} entries"
+
 
 # Module-level client for backwards compatibility
 # This is set by the CLI when it initializes
@@ -252,7 +393,15 @@ _client: Optional[APIClient] = None
 
 
 def _get_client(**kwargs: Any) -> APIClient:
-    """Get or create an API client instance."""
+    """
+    Get or create an API client instance.
+
+    Without an explicitly set client, a fallback client is built from the
+    stored API key. A fallback created without overrides is kept as the
+    module-level client, so later calls reuse its session instead of
+    re-reading the config and reconnecting every time.
+    """
+    global _client
     if _client is not None:
         return _client
 
@@ -260,7 +409,10 @@ def _get_client(**kwargs: Any) -> APIClient:
     from .config import load_api_key
 
     api_key = load_api_key()
-    return APIClient(api_key, **kwargs)
+    if kwargs:
+        return APIClient(api_key, **kwargs)
+    _client = APIClient(api_key)
+    return _client
 
 
 def set_client(client: APIClient) -> None:
@@ -281,13 +433,13 @@ def clear_client() -> None:
 def api_call(
     method: str,
     endpoint: str,
-    data: Optional[Dict[str, Any]] = None,
+    data: Optional[Any] = None,
     retries: int = DEFAULT_RETRIES,
     delay: float = DEFAULT_DELAY,
     timeout: float = DEFAULT_TIMEOUT,
 ) -> Optional[Dict[str, Any]]:
     """Make an API request to NextDNS (backwards-compatible wrapper)."""
-    client = _get_client(retries=retries, delay=delay, timeout=timeout)
+    client = _get_client()
     return client.call(method, endpoint, data, retries, delay, timeout)
 
 
@@ -321,6 +473,12 @@ def remove_from_domain_list(profile_id: str, list_type: str, domain: str, **kwar
     return client.remove_from_domain_list(profile_id, list_type, domain)
 
 
+def replace_domain_list(profile_id: str, list_type: str, entries: List[Dict[str, Any]], **kwargs: Any) -> str:
+    """Replace the whole list (denylist/allowlist) in a single request."""
+    client = _get_client(**kwargs)
+    return client.replace_domain_list(profile_id, list_type, entries)
+
+
 # Convenience wrappers for backwards compatibility
 def get_denylist(profile_id: str, **kwargs: Any) -> List[Dict[str, Any]]:
     """Retrieve the current denylist for a profile."""
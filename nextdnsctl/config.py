@@ -1,9 +1,14 @@
+import hashlib
 import json
 import os
 import stat
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 CONFIG_DIR: str = os.path.expanduser("~/.nextdnsctl")
 CONFIG_FILE: str = os.path.join(CONFIG_DIR, "config.json")
+PROFILES_CACHE_FILE: str = os.path.join(CONFIG_DIR, "profiles_cache.json")
+PROFILES_CACHE_TTL: int = 300  # seconds
 ENV_VAR_NAME: str = "NEXTDNS_API_KEY"
 
 
@@ -39,3 +44,73 @@ def load_api_key() -> str:
         if "api_key" not in config:
             raise ValueError("Invalid config file. Run 'nextdnsctl auth <api_key>' to set up.")
         return config["api_key"]
+
+
+def _api_key_fingerprint(api_key: str) -> str:
+    """Identify an API key in the profiles cache without storing the key itself."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _read_profiles_cache(api_key: str) -> Optional[Dict[str, Any]]:
+    """Read the profiles cache file if it belongs to the given API key."""
+    try:
+        with open(PROFILES_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("key") != _api_key_fingerprint(api_key):
+        return None
+    if not isinstance(cache.get("profiles"), list):
+        return None
+    return cache
+
+
+def load_cached_profiles(api_key: str, ttl: int = PROFILES_CACHE_TTL) -> Optional[List[Dict[str, Any]]]:
+    """
+    Load the cached profiles list for an API key.
+
+    Returns None if there is no cache file, it belongs to another API key,
+    it is older than ttl seconds, or it cannot be read.
+    """
+    try:
+        if os.path.getmtime(PROFILES_CACHE_FILE) + ttl <= time.time():
+            return None
+    except OSError:
+        return None
+    cache = _read_profiles_cache(api_key)
+    return cache["profiles"] if cache is not None else None
+
+
+def load_profiles_etag(api_key: str) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    Load the ETag and profiles list from the cache, regardless of its age.
+
+    An expired cache can still be revalidated with If-None-Match. Returns
+    None if the cache is unusable or was saved without an ETag.
+    """
+    cache = _read_profiles_cache(api_key)
+    if cache is None or not cache.get("etag"):
+        return None
+    return cache["etag"], cache["profiles"]
+
+
+def save_cached_profiles(api_key: str, profiles: List[Dict[str, Any]], etag: Optional[str] = None) -> None:
+    """
+    Cache the profiles list for an API key, along with its ETag if known.
+
+    The file is written to a temporary path first and moved into place, so
+    concurrent invocations never read a partially written cache. Failures are
+    ignored since the cache is only an optimization.
+    """
+    tmp_file = f"{PROFILES_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(PROFILES_CACHE_FILE), mode=0o700, exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump({"key": _api_key_fingerprint(api_key), "etag": etag, "profiles": profiles}, f)
+        os.chmod(tmp_file, stat.S_IRUSR | stat.S_IWUSR)
+        os.replace(tmp_file, PROFILES_CACHE_FILE)
+    except OSError:
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
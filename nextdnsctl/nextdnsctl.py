@@ -1,23 +1,38 @@
 import atexit
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import filterfalse, islice
+from operator import methodcaller
 from typing import (
     Any,
     Callable,
+    Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
     Sequence,
+    Set,
     Tuple,
 )  # noqa: F401
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from . import __version__
-from .config import save_api_key, load_api_key
+from .config import (
+    save_api_key,
+    load_api_key,
+    load_cached_profiles,
+    load_profiles_etag,
+    save_cached_profiles,
+)
 from .api import (
     APIClient,
+    APIError,
     set_client,
     clear_client,
     validate_domain,
@@ -26,9 +41,68 @@ from .api import (
     DEFAULT_DELAY,
     DEFAULT_TIMEOUT,
     RateLimitStillActiveError,
+    USER_AGENT,
 )
 
 DEFAULT_CONCURRENCY = 5
+OUTPUT_BATCH_SIZE = 100  # Result lines per write when stdout is not a terminal
+EXPORT_BUFFER_SIZE = 1 << 20  # Write buffer for export files
+
+# Sinkhole addresses used by hosts-file style blocklists
+HOSTS_FILE_ADDRESSES = frozenset({"0.0.0.0", "127.0.0.1", "::", "::1"})
+
+# Entries without an "active" flag count as active
+_is_active = methodcaller("get", "active", True)
+
+
+def _load_profiles(ctx: click.Context, allow_disk_cache: bool = True) -> List[Dict[str, Any]]:
+    """
+    Load the profiles list into ctx.obj, preferring the on-disk cache.
+
+    The disk cache is skipped with --no-profile-cache or --refresh-profiles,
+    and whenever allow_disk_cache is False. Profiles fetched from the API are
+    written back to the disk cache unless --no-profile-cache is given.
+    """
+    client: APIClient = ctx.obj["client"]
+    use_disk_cache = ctx.obj.get("profile_cache", True)
+
+    if use_disk_cache and allow_disk_cache and not ctx.obj.get("refresh_profiles", False):
+        profiles = load_cached_profiles(client.api_key)
+        if profiles is not None:
+            _store_profiles(ctx, profiles, from_disk=True)
+            return profiles
+
+    if use_disk_cache:
+        # An expired cache can still be revalidated instead of re-downloaded
+        cached = load_profiles_etag(client.api_key)
+        if cached is not None:
+            etag, profiles = cached
+            client.prime_etag("profiles", etag, {"data": profiles})
+
+    try:
+        profiles = client.get_profiles()
+    except Exception as e:
+        raise click.ClickException(f"Failed to fetch profiles: {e}")
+    if use_disk_cache:
+        save_cached_profiles(client.api_key, profiles, client.get_etag("profiles"))
+    _store_profiles(ctx, profiles, from_disk=False)
+    return profiles
+
+
+def _store_profiles(ctx: click.Context, profiles: List[Dict[str, Any]], from_disk: bool) -> None:
+    """Store the profiles list in ctx.obj along with ID and name lookup tables."""
+    ctx.obj["profiles_cache"] = profiles
+    ctx.obj["profiles_from_disk"] = from_disk
+    ctx.obj["profiles_by_id"] = {p["id"]: p for p in profiles if p.get("id")}
+    # Built in reverse so the first profile wins if two share a name
+    ctx.obj["profiles_by_name"] = {p.get("name", "").lower(): p["id"] for p in reversed(profiles) if p.get("id")}
+
+
+def _find_profile_id(ctx: click.Context, profile_identifier: str) -> Optional[str]:
+    """Find a loaded profile by ID, or else by name (case-insensitive)."""
+    if profile_identifier in ctx.obj["profiles_by_id"]:
+        return profile_identifier
+    return ctx.obj["profiles_by_name"].get(profile_identifier.lower())
 
 
 def _resolve_profile_id(ctx: click.Context, profile_identifier: str) -> str:
@@ -37,50 +111,61 @@ def _resolve_profile_id(ctx: click.Context, profile_identifier: str) -> str:
 
     If the identifier matches an existing profile ID, return it directly.
     Otherwise, search for a profile with a matching name.
-    Caches the profiles list in ctx.obj to avoid repeated API calls.
+    Caches the profiles list in ctx.obj and on disk to avoid repeated API calls;
+    the disk cache is only used as is for ID matches.
     """
-    client: APIClient = ctx.obj["client"]
-
-    # Get or fetch profiles (cache in ctx.obj)
     if "profiles_cache" not in ctx.obj:
-        try:
-            ctx.obj["profiles_cache"] = client.get_profiles()
-        except Exception as e:
-            raise click.ClickException(f"Failed to fetch profiles: {e}")
+        _load_profiles(ctx)
 
-    profiles = ctx.obj["profiles_cache"]
-
-    # First, check if it's a direct ID match
-    for profile in profiles:
-        if profile.get("id") == profile_identifier:
-            return profile_identifier
+    if ctx.obj.get("profiles_from_disk") and profile_identifier not in ctx.obj["profiles_by_id"]:
+        # The disk cache is only trusted for exact ID matches: a name may have
+        # moved to another profile, or the profile may be newer than the cache.
+        # Revalidating is usually a cheap 304 thanks to the cached ETag.
+        _load_profiles(ctx, allow_disk_cache=False)
 
-    # Otherwise, search by name (case-insensitive)
-    for profile in profiles:
-        if profile.get("name", "").lower() == profile_identifier.lower():
-            return profile["id"]
+    profile_id = _find_profile_id(ctx, profile_identifier)
+    if profile_id is not None:
+        return profile_id
 
     # No match found
+    profiles = ctx.obj["profiles_cache"]
     available = ", ".join(f"'{p.get('name')}' ({p.get('id')})" for p in profiles)
     raise click.ClickException(f"Profile '{profile_identifier}' not found. " f"Available profiles: {available}")
 
 
-def _validate_domains(domains: Sequence[str]) -> tuple[list[str], list[str]]:
+def _validate_domains(domains: Iterable[str]) -> tuple[list[str], list[str]]:
     """
-    Validate a list of domains.
+    Validate domains from any iterable, consuming it in a single pass.
+
+    Duplicates (after normalization) are dropped, keeping the first occurrence,
+    so each domain costs at most one API call.
 
     Returns:
         Tuple of (valid_domains, invalid_domains)
     """
-    valid = []
+    valid: Dict[str, None] = {}  # Ordered set of normalized domains
     invalid = []
     for domain in domains:
         try:
-            validated = validate_domain(domain)
-            valid.append(validated)
+            valid[validate_domain(domain)] = None
         except InvalidDomainError as e:
             invalid.append(str(e))
-    return valid, invalid
+    return list(valid), invalid
+
+
+def _normalize_domains(domains: Iterable[str]) -> List[str]:
+    """
+    Normalize domains the way list entries are stored, without validating them.
+
+    Strips whitespace and trailing root dots and lowercases each domain.
+    Empty entries and duplicates (after normalization) are dropped.
+    """
+    normalized: Dict[str, None] = {}  # Ordered set of normalized domains
+    for domain in domains:
+        domain = domain.strip().lower().rstrip(".")
+        if domain:
+            normalized[domain] = None
+    return list(normalized)
 
 
 # Helper function to perform operations on a list of domains
@@ -106,8 +191,9 @@ def _perform_domain_operations(
     if dry_run:
         return _perform_domain_operations_dry_run(domains_to_process, item_name_singular, action_verb)
 
-    # Sequential mode (concurrency == 1): preserve original verbose behavior
-    if concurrency == 1:
+    # Sequential mode (concurrency == 1): preserve original verbose behavior.
+    # A single domain also runs inline; a worker pool would only add overhead.
+    if concurrency == 1 or len(domains_to_process) == 1:
         return _perform_domain_operations_sequential(
             ctx, domains_to_process, operation_callable, item_name_singular, action_verb
         )
@@ -143,29 +229,56 @@ def _perform_domain_operations_sequential(
     item_name_singular: str,
     action_verb: str,
 ) -> bool:
-    """Sequential execution with verbose per-domain output (original behavior)."""
+    """
+    Sequential execution with verbose per-domain output (original behavior).
+
+    When stdout is not a terminal (redirected to a file or pipe), result lines
+    are written in batches of OUTPUT_BATCH_SIZE instead of one flush per domain.
+    """
+    quiet = ctx.obj.get("quiet", False)
+    buffer_output = not sys.stdout.isatty()
+    pending_output: List[str] = []
     all_successful = True
     failure_count = 0
-    for item_value in domains_to_process:
-        try:
-            result = operation_callable(item_value)
-            click.echo(result)
-        except RateLimitStillActiveError as e:
-            click.echo(
-                f"\nCRITICAL ERROR: Domain '{item_value}' could not be {action_verb}ed "
-                f"due to persistent rate limiting.",
-                err=True,
-            )
-            click.echo(f"Detail: {e}", err=True)
-            click.echo("Aborting further operations for this command.", err=True)
-            ctx.exit(1)
-        except Exception as e:
-            all_successful = False
-            failure_count += 1
-            click.echo(
-                f"Failed to {action_verb} {item_name_singular} '{item_value}': {e}",
-                err=True,
-            )
+
+    def flush_output() -> None:
+        if pending_output:
+            click.echo("\n".join(pending_output))
+            pending_output.clear()
+
+    # Flush on any exit, including KeyboardInterrupt, since the buffered lines
+    # are the only record of which domains were already changed
+    try:
+        for item_value in domains_to_process:
+            try:
+                result = operation_callable(item_value)
+                if quiet:
+                    continue
+                if buffer_output:
+                    pending_output.append(result)
+                    if len(pending_output) >= OUTPUT_BATCH_SIZE:
+                        flush_output()
+                else:
+                    click.echo(result)
+            except RateLimitStillActiveError as e:
+                flush_output()
+                click.echo(
+                    f"\nCRITICAL ERROR: Domain '{item_value}' could not be {action_verb}ed "
+                    f"due to persistent rate limiting.",
+                    err=True,
+                )
+                click.echo(f"Detail: {e}", err=True)
+                click.echo("Aborting further operations for this command.", err=True)
+                ctx.exit(1)
+            except Exception as e:
+                all_successful = False
+                failure_count += 1
+                click.echo(
+                    f"Failed to {action_verb} {item_name_singular} '{item_value}': {e}",
+                    err=True,
+                )
+    finally:
+        flush_output()
     if not all_successful and failure_count > 0:
         click.echo(
             f"\nWarning: {failure_count} {item_name_singular}(s) could not be {action_verb}ed " f"due to other errors.",
@@ -182,37 +295,46 @@ def _perform_domain_operations_parallel(
     action_verb: str,
     concurrency: int,
 ) -> bool:
-    """Parallel execution with progress bar and summary output."""
-    rate_limit_hit = threading.Event()
+    """
+    Parallel execution with progress bar and summary output.
+
+    Workers only run the operation; results, errors and the rate-limit abort
+    are all tracked here on the submitting thread, so no shared state needs
+    synchronization.
+    """
     results = {"success": 0, "failed": 0, "skipped": 0}
     errors = []  # Collect errors to print after progress bar
     rate_limit_aborted = False
 
     total_domains = len(domains_to_process)
-
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        futures = {}
-        for domain in domains_to_process:
-            if rate_limit_hit.is_set():
-                results["skipped"] += 1
-                continue
+    pending_domains = iter(domains_to_process)
+    # Keep a bounded window of futures in flight instead of submitting every
+    # domain up front, so memory stays flat and a rate-limit abort stops
+    # further submissions right away
+    max_in_flight = 2 * concurrency
+
+    progress_bar: Any = click.progressbar(
+        length=total_domains,
+        label=f"Processing {item_name_singular}s",
+        show_pos=True,
+        hidden=ctx.obj.get("quiet", False),
+        # Redraw at most ~200 times instead of on every completed domain
+        update_min_steps=max(1, total_domains // 200),
+    )
+    # Don't spin up more worker threads than there are domains to process
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, total_domains))) as executor, progress_bar as bar:
+        futures: Dict[Future, str] = {}
+        for domain in islice(pending_domains, max_in_flight):
             futures[executor.submit(operation_callable, domain)] = domain
 
-        submitted_count = len(futures)
-
-        progress_bar: Any = click.progressbar(
-            length=submitted_count,
-            label=f"Processing {item_name_singular}s",
-            show_pos=True,
-        )
-        with progress_bar as bar:
-            for future in as_completed(futures):
-                domain = futures[future]
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                domain = futures.pop(future)
                 try:
                     future.result()
                     results["success"] += 1
                 except RateLimitStillActiveError as e:
-                    rate_limit_hit.set()
                     rate_limit_aborted = True
                     results["failed"] += 1
                     errors.append(f"CRITICAL: '{domain}' - persistent rate limiting: {e}")
@@ -221,6 +343,17 @@ def _perform_domain_operations_parallel(
                     errors.append(f"Failed to {action_verb} '{domain}': {e}")
                 bar.update(1)
 
+            if not rate_limit_aborted:
+                for domain in islice(pending_domains, max_in_flight - len(futures)):
+                    futures[executor.submit(operation_callable, domain)] = domain
+
+        # Draw any steps still below update_min_steps; older Click versions
+        # never render them, leaving the bar short of the total
+        bar.update_min_steps = 1
+        bar.update(0)
+
+    results["skipped"] = total_domains - results["success"] - results["failed"]
+
     # Print any errors that occurred
     for error in errors:
         click.echo(error, err=True)
@@ -244,6 +377,140 @@ def _perform_domain_operations_parallel(
     return results["failed"] == 0
 
 
+def _fetch_list_ids(client: APIClient, profile_id: str, list_type: str) -> Set[str]:
+    """Fetch the set of domains currently on a list."""
+    try:
+        return {entry["id"] for entry in client.get_domain_list(profile_id, list_type) if entry.get("id")}
+    except Exception as e:
+        raise click.ClickException(f"Failed to fetch {list_type}: {e}")
+
+
+def _skip_existing_domains(
+    client: APIClient,
+    profile_id: str,
+    list_type: str,
+    domains: Sequence[str],
+) -> List[str]:
+    """Drop domains that are already on the list, reporting how many were skipped."""
+    existing = _fetch_list_ids(client, profile_id, list_type)
+    remaining = [domain for domain in domains if domain not in existing]
+    already_present = len(domains) - len(remaining)
+    if already_present:
+        click.echo(f"Skipping {already_present} domain(s) already in the {list_type}.", err=True)
+    return remaining
+
+
+def _skip_missing_domains(
+    client: APIClient,
+    profile_id: str,
+    list_type: str,
+    domains: Sequence[str],
+) -> List[str]:
+    """Drop domains that are not on the list, reporting how many were skipped."""
+    existing = _fetch_list_ids(client, profile_id, list_type)
+    remaining = [domain for domain in domains if domain in existing]
+    not_present = len(domains) - len(remaining)
+    if not_present:
+        click.echo(f"Skipping {not_present} domain(s) not in the {list_type}.", err=True)
+    return remaining
+
+
+def _perform_bulk_add(
+    ctx: click.Context,
+    client: APIClient,
+    profile_id: str,
+    list_type: str,
+    domains_to_add: Sequence[str],
+    active: bool,
+) -> bool:
+    """
+    Add domains with a single request by replacing the list with its merged contents.
+
+    Fetches the current list once, appends the domains that are not on it yet
+    and PUTs the result back. Existing entries keep their active flag.
+    Returns True on success, False otherwise.
+    """
+    try:
+        entries = client.get_domain_list(profile_id, list_type)
+    except Exception as e:
+        click.echo(f"Error fetching {list_type}: {e}", err=True)
+        return False
+
+    existing = {entry.get("id") for entry in entries}
+    new_domains = [domain for domain in dict.fromkeys(domains_to_add) if domain not in existing]
+    already_present = len(domains_to_add) - len(new_domains)
+    if already_present:
+        click.echo(f"Skipping {already_present} domain(s) already in the {list_type}.", err=True)
+
+    if not new_domains:
+        click.echo(f"Nothing to add, all domains are already in the {list_type}.", err=True)
+        return True
+
+    if ctx.obj.get("dry_run", False):
+        return _perform_domain_operations_dry_run(new_domains, "domain", "add")
+
+    merged = entries + [{"id": domain, "active": active} for domain in new_domains]
+    try:
+        client.replace_domain_list(profile_id, list_type, merged)
+    except RateLimitStillActiveError as e:
+        click.echo(f"\nCRITICAL ERROR: {list_type} could not be updated due to persistent rate limiting.", err=True)
+        click.echo(f"Detail: {e}", err=True)
+        ctx.exit(1)
+    except Exception as e:
+        click.echo(f"Failed to add {len(new_domains)} domain(s) to the {list_type}: {e}", err=True)
+        return False
+
+    click.echo(f"Added {len(new_domains)} domain(s) as {'active' if active else 'inactive'} in a single request.")
+    return True
+
+
+def _perform_bulk_remove(
+    ctx: click.Context,
+    client: APIClient,
+    profile_id: str,
+    list_type: str,
+    domains_to_remove: Sequence[str],
+) -> bool:
+    """
+    Remove domains with a single request by replacing the list with what remains.
+
+    Fetches the current list once, drops the given domains and PUTs the rest
+    back. Returns True on success, False otherwise.
+    """
+    try:
+        entries = client.get_domain_list(profile_id, list_type)
+    except Exception as e:
+        click.echo(f"Error fetching {list_type}: {e}", err=True)
+        return False
+
+    to_remove = set(domains_to_remove)
+    remaining = [entry for entry in entries if entry.get("id") not in to_remove]
+    removed = [entry["id"] for entry in entries if entry.get("id") in to_remove]
+    not_present = len(to_remove) - len(removed)
+    if not_present:
+        click.echo(f"Skipping {not_present} domain(s) not in the {list_type}.", err=True)
+
+    if not removed:
+        click.echo(f"Nothing to remove, none of the domains are in the {list_type}.", err=True)
+        return True
+
+    if ctx.obj.get("dry_run", False):
+        return _perform_domain_operations_dry_run(removed, "domain", "remove")
+
+    try:
+        client.replace_domain_list(profile_id, list_type, remaining)
+    except RateLimitStillActiveError as e:
+        click.echo(f"\nCRITICAL ERROR: {list_type} could not be updated due to persistent rate limiting.", err=True)
+        click.echo(f"Detail: {e}", err=True)
+        ctx.exit(1)
+    except Exception as e:
+        click.echo(f"Failed to remove {len(removed)} domain(s) from the {list_type}: {e}", err=True)
+        return False
+
+    click.echo(f"Removed {len(removed)} domain(s) in a single request.")
+    return True
+
+
 @click.group()
 @click.version_option(__version__)
 @click.option(
@@ -279,8 +546,24 @@ def _perform_domain_operations_parallel(
     is_flag=True,
     help="Show what would be done without making changes",
 )
+@click.option(
+    "--quiet",
+    "-q",
+    is_flag=True,
+    help="Suppress per-domain output and progress bars (errors and summaries are still shown)",
+)
+@click.option(
+    "--no-profile-cache",
+    is_flag=True,
+    help="Neither read nor write the on-disk profiles cache",
+)
+@click.option(
+    "--refresh-profiles",
+    is_flag=True,
+    help="Fetch profiles from the API even if the on-disk cache is fresh",
+)
 @click.pass_context
-def cli(ctx, retry_attempts, retry_delay, timeout, concurrency, dry_run):
+def cli(ctx, retry_attempts, retry_delay, timeout, concurrency, dry_run, quiet, no_profile_cache, refresh_profiles):
     """nextdnsctl: A CLI tool for managing NextDNS profiles."""
     ctx.obj = {
         "retry_attempts": retry_attempts,
@@ -288,6 +571,9 @@ def cli(ctx, retry_attempts, retry_delay, timeout, concurrency, dry_run):
         "timeout": timeout,
         "concurrency": concurrency,
         "dry_run": dry_run,
+        "quiet": quiet,
+        "profile_cache": not no_profile_cache,
+        "refresh_profiles": refresh_profiles,
     }
 
     # Initialize API client once (except for auth command which doesn't need it)
@@ -300,6 +586,8 @@ def cli(ctx, retry_attempts, retry_delay, timeout, concurrency, dry_run):
                 retries=retry_attempts,
                 delay=retry_delay,
                 timeout=timeout,
+                # One pooled connection per worker thread
+                pool_maxsize=concurrency,
             )
             ctx.obj["client"] = client
             set_client(client)
@@ -317,6 +605,8 @@ def auth(api_key):
     """Save your NextDNS API key."""
     try:
         save_api_key(api_key)
+        # Drop any client still holding the previous key
+        clear_client()
         # Verify it works by making a test call
         load_api_key()
         click.echo("API key saved successfully.")
@@ -334,6 +624,8 @@ def profile_list(ctx):
     try:
         client: APIClient = ctx.obj["client"]
         profiles = client.get_profiles()
+        if ctx.obj.get("profile_cache", True):
+            save_cached_profiles(client.api_key, profiles, client.get_etag("profiles"))
         if not profiles:
             click.echo("No profiles found.")
             return
@@ -344,40 +636,89 @@ def profile_list(ctx):
         raise click.Abort()
 
 
+# Session for downloading import sources, shared across imports in a process.
+# Kept separate from the API session so the API key is never sent to list hosts.
+_download_session: Optional[requests.Session] = None
+
+
+def _get_download_session() -> requests.Session:
+    """Get or create the session used to download import sources."""
+    global _download_session
+    if _download_session is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        # Downloads are idempotent GETs, so transient server errors can be retried
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        atexit.register(session.close)
+        _download_session = session
+    return _download_session
+
+
 def read_domains_from_source(source: str) -> Iterator[str]:
     """
-    Read domains from a file or URL, yielding one domain per line.
+    Read domains from a file or URL, yielding each domain as it is read.
 
     Handles:
     - Comment lines (starting with #)
     - Inline comments (e.g., "example.com # bad site")
     - Empty lines and whitespace
+    - Hosts-file entries, including several names on one line
     - Streaming for memory efficiency with large files
     """
     if source.startswith("http://") or source.startswith("https://"):
-        response = requests.get(source, stream=True, timeout=DEFAULT_TIMEOUT)
-        response.raise_for_status()
-        for line in response.iter_lines(decode_unicode=True):
-            if line:
-                domain = _parse_domain_line(line)
-                if domain:
-                    yield domain
+        # Close the streamed response even if the consumer stops early
+        session = _get_download_session()
+        with session.get(source, stream=True, timeout=DEFAULT_TIMEOUT) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(decode_unicode=True):
+                if line:
+                    yield from _parse_domain_names(line)
     else:
         with open(source, "r") as f:
             for line in f:
-                domain = _parse_domain_line(line)
-                if domain:
-                    yield domain
+                yield from _parse_domain_names(line)
 
 
-def _parse_domain_line(line: str) -> Optional[str]:
-    """Parse a single line, handling comments and whitespace."""
+def _parse_domain_names(line: str) -> List[str]:
+    """Parse a single line into the domains it lists, handling comments, whitespace and hosts-file entries."""
     # Strip inline comments (e.g., "example.com # bad site" -> "example.com")
-    line = line.split("#")[0].strip()
-    return line if line else None
+    line = line.partition("#")[0].strip()
+    if not line:
+        return []
+    # Plain domain lines are the common case and need no splitting
+    if " " not in line and "\t" not in line:
+        return [line]
+    # Hosts-file format, which may map several names to one address
+    # (e.g., "0.0.0.0 a.com b.com" -> ["a.com", "b.com"])
+    fields = line.split()
+    if len(fields) > 1 and fields[0] in HOSTS_FILE_ADDRESSES:
+        return fields[1:]
+    return [line]
+
+
+def _parse_domain_line(line: str) -> Optional[str]:
+    """Parse a single line into its first domain; see _parse_domain_names for all of them."""
+    names = _parse_domain_names(line)
+    return names[0] if names else None
 
 
 # Shared command handlers for denylist/allowlist
+def _filter_entries(
+    entries: List[Dict[str, Any]],
+    active_only: bool,
+    inactive_only: bool,
+) -> List[Dict[str, Any]]:
+    """Return only the active or only the inactive entries, or all of them if neither is requested."""
+    if active_only:
+        return list(filter(_is_active, entries))
+    if inactive_only:
+        return list(filterfalse(_is_active, entries))
+    return entries
+
+
 def _handle_list_command(
     ctx: click.Context,
     profile: str,
@@ -396,10 +737,7 @@ def _handle_list_command(
             click.echo(f"{list_type.capitalize()} is empty.")
             return
 
-        if active_only:
-            entries = [e for e in entries if e.get("active", True)]
-        elif inactive_only:
-            entries = [e for e in entries if not e.get("active", True)]
+        entries = _filter_entries(entries, active_only, inactive_only)
 
         if not entries:
             click.echo("No matching entries found.")
@@ -423,6 +761,8 @@ def _handle_add_command(
     list_type: str,
     domains: Tuple[str, ...],
     inactive: bool,
+    bulk: bool = False,
+    skip_existing: bool = False,
 ) -> None:
     """Shared handler for add commands."""
     if "client" not in ctx.obj:
@@ -445,15 +785,20 @@ def _handle_add_command(
     profile_id = _resolve_profile_id(ctx, profile)
     client: APIClient = ctx.obj["client"]
 
-    def operation(domain_name):
-        return client.add_to_domain_list(
-            profile_id,
-            list_type,
-            domain_name,
-            active=not inactive,
-        )
+    if skip_existing and not bulk:
+        valid_domains = _skip_existing_domains(client, profile_id, list_type, valid_domains)
+        if not valid_domains:
+            click.echo(f"Nothing to add, all domains are already in the {list_type}.", err=True)
+            return
+
+    operation = partial(client.add_to_domain_list, profile_id, list_type, active=not inactive)
 
-    success = _perform_domain_operations(ctx, valid_domains, operation, item_name_singular="domain", action_verb="add")
+    if bulk:
+        success = _perform_bulk_add(ctx, client, profile_id, list_type, valid_domains, active=not inactive)
+    else:
+        success = _perform_domain_operations(
+            ctx, valid_domains, operation, item_name_singular="domain", action_verb="add"
+        )
     if not success:
         ctx.exit(1)
 
@@ -466,6 +811,8 @@ def _handle_remove_command(
     profile: str,
     list_type: str,
     domains: Tuple[str, ...],
+    skip_missing: bool = False,
+    bulk: bool = False,
 ) -> None:
     """Shared handler for remove commands."""
     if "client" not in ctx.obj:
@@ -474,17 +821,33 @@ def _handle_remove_command(
         click.echo("No domains provided.", err=True)
         raise click.Abort()
 
+    # Normalize so input matches the IDs stored in the list, but don't reject
+    # entries that fail validation; they may still be on the list
+    valid_domains = _normalize_domains(domains)
+    if not valid_domains:
+        click.echo("No domains provided.", err=True)
+        raise click.Abort()
+
     profile_id = _resolve_profile_id(ctx, profile)
     client: APIClient = ctx.obj["client"]
 
-    def operation(domain_name):
-        return client.remove_from_domain_list(
-            profile_id,
-            list_type,
-            domain_name,
-        )
+    if bulk:
+        if not _perform_bulk_remove(ctx, client, profile_id, list_type, valid_domains):
+            ctx.exit(1)
+        return
 
-    success = _perform_domain_operations(ctx, domains, operation, item_name_singular="domain", action_verb="remove")
+    domains_to_remove: Sequence[str] = valid_domains
+    if skip_missing:
+        domains_to_remove = _skip_missing_domains(client, profile_id, list_type, valid_domains)
+        if not domains_to_remove:
+            click.echo(f"Nothing to remove, none of the domains are in the {list_type}.", err=True)
+            return
+
+    operation = partial(client.remove_from_domain_list, profile_id, list_type)
+
+    success = _perform_domain_operations(
+        ctx, domains_to_remove, operation, item_name_singular="domain", action_verb="remove"
+    )
     if not success:
         ctx.exit(1)
 
@@ -495,6 +858,8 @@ def _handle_import_command(
     list_type: str,
     source: str,
     inactive: bool,
+    bulk: bool = False,
+    skip_existing: bool = False,
 ) -> None:
     """Shared handler for import commands."""
     if "client" not in ctx.obj:
@@ -502,34 +867,51 @@ def _handle_import_command(
     profile_id = _resolve_profile_id(ctx, profile)
     client: APIClient = ctx.obj["client"]
 
+    lines_read = 0
+
+    def count_lines(lines: Iterable[str]) -> Iterator[str]:
+        nonlocal lines_read
+        for line in lines:
+            lines_read += 1
+            yield line
+
     try:
-        # Use generator to stream file/URL and collect domains
-        # This avoids loading raw file content into memory
-        raw_domains = list(read_domains_from_source(source))
+        # Validate while streaming the file/URL, so raw lines are never
+        # collected in memory; only the validated domains are kept
+        valid_domains, invalid_domains = _validate_domains(count_lines(read_domains_from_source(source)))
     except Exception as e:
         click.echo(f"Error reading source: {e}", err=True)
         raise click.Abort()
 
-    if not raw_domains:
+    if not valid_domains and not invalid_domains:
         click.echo("No domains found in source.", err=True)
         return
 
-    # Validate domains
-    valid_domains, invalid_domains = _validate_domains(raw_domains)
     if invalid_domains:
         click.echo(f"Skipped {len(invalid_domains)} invalid domain(s).", err=True)
 
+    duplicates = lines_read - len(valid_domains) - len(invalid_domains)
+    if duplicates:
+        click.echo(f"Skipped {duplicates} duplicate domain(s).", err=True)
+
     if not valid_domains:
         click.echo("No valid domains to import.", err=True)
         return
 
-    def operation(domain_name):
-        return client.add_to_domain_list(
-            profile_id,
-            list_type,
-            domain_name,
-            active=not inactive,
-        )
+    if bulk:
+        if not _perform_bulk_add(ctx, client, profile_id, list_type, valid_domains, active=not inactive):
+            ctx.exit(1)
+        if not ctx.obj.get("dry_run", False):
+            click.echo(f"\nView at: https://my.nextdns.io/{profile_id}/{list_type}")
+        return
+
+    if skip_existing:
+        valid_domains = _skip_existing_domains(client, profile_id, list_type, valid_domains)
+        if not valid_domains:
+            click.echo(f"Nothing to add, all domains are already in the {list_type}.", err=True)
+            return
+
+    operation = partial(client.add_to_domain_list, profile_id, list_type, active=not inactive)
 
     success = _perform_domain_operations(
         ctx,
@@ -545,6 +927,14 @@ def _handle_import_command(
         click.echo(f"\nView at: https://my.nextdns.io/{profile_id}/{list_type}")
 
 
+def _iter_export_lines(entries: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield one newline-terminated line per domain, skipping entries without an ID."""
+    for entry in entries:
+        domain = entry.get("id")
+        if domain:
+            yield domain + "\n"
+
+
 def _handle_export_command(
     ctx: click.Context,
     profile: str,
@@ -564,24 +954,21 @@ def _handle_export_command(
             click.echo(f"{list_type.capitalize()} is empty, nothing to export.", err=True)
             return
 
-        if active_only:
-            entries = [e for e in entries if e.get("active", True)]
-        elif inactive_only:
-            entries = [e for e in entries if not e.get("active", True)]
+        entries = _filter_entries(entries, active_only, inactive_only)
 
         if not entries:
             click.echo("No matching entries to export.", err=True)
             return
 
-        domains = [entry.get("id", "") for entry in entries if entry.get("id")]
-        content = "\n".join(domains) + "\n"
-
         if output == "-":
-            click.echo(content, nl=False)
+            sys.stdout.writelines(_iter_export_lines(entries))
         else:
-            with open(output, "w") as f:
-                f.write(content)
-            click.echo(f"Exported {len(domains)} domains to {output}", err=True)
+            exported = 0
+            with open(output, "w", buffering=EXPORT_BUFFER_SIZE) as f:
+                for line in _iter_export_lines(entries):
+                    f.write(line)
+                    exported += 1
+            click.echo(f"Exported {exported} domains to {output}", err=True)
     except Exception as e:
         click.echo(f"Error exporting {list_type}: {e}", err=True)
         raise click.Abort()
@@ -592,8 +979,14 @@ def _handle_clear_command(
     profile: str,
     list_type: str,
     yes: bool,
+    bulk: bool = False,
 ) -> None:
-    """Shared handler for clear commands."""
+    """
+    Shared handler for clear commands.
+
+    With bulk, the list is emptied with a single PUT. If the API rejects that
+    with 404/405, the domains are removed one by one instead.
+    """
     if "client" not in ctx.obj:
         raise click.ClickException("No API key configured. Run 'nextdnsctl auth <api_key>' first.")
     try:
@@ -616,12 +1009,21 @@ def _handle_clear_command(
                 abort=True,
             )
 
-        def operation(domain_name):
-            return client.remove_from_domain_list(
-                profile_id,
-                list_type,
-                domain_name,
-            )
+        if bulk and not dry_run:
+            try:
+                client.replace_domain_list(profile_id, list_type, [])
+            except APIError as e:
+                if e.status_code not in (404, 405):
+                    raise
+                click.echo(
+                    f"Bulk clear not supported (Status: {e.status_code}), removing domains one by one.",
+                    err=True,
+                )
+            else:
+                click.echo(f"Removed {len(domains)} domain(s) in a single request.")
+                return
+
+        operation = partial(client.remove_from_domain_list, profile_id, list_type)
 
         success = _perform_domain_operations(ctx, domains, operation, item_name_singular="domain", action_verb="remove")
         if not success:
@@ -633,132 +1035,79 @@ def _handle_clear_command(
         raise click.Abort()
 
 
-@cli.group("denylist")
-def denylist():
-    """Manage the NextDNS denylist."""
-
-
-@denylist.command("list")
-@click.argument("profile")
-@click.option("--active-only", is_flag=True, help="Show only active entries")
-@click.option("--inactive-only", is_flag=True, help="Show only inactive entries")
-@click.pass_context
-def denylist_list(ctx, profile, active_only, inactive_only):
-    """List all domains in the NextDNS denylist."""
-    _handle_list_command(ctx, profile, "denylist", active_only, inactive_only)
-
-
-@denylist.command("add")
-@click.argument("profile")
-@click.argument("domains", nargs=-1)
-@click.option("--inactive", is_flag=True, help="Add domains as inactive (not blocked)")
-@click.pass_context
-def denylist_add(ctx, profile, domains, inactive):
-    """Add domains to the NextDNS denylist."""
-    _handle_add_command(ctx, profile, "denylist", domains, inactive)
-
-
-@denylist.command("remove")
-@click.argument("profile")
-@click.argument("domains", nargs=-1)
-@click.pass_context
-def denylist_remove(ctx, profile, domains):
-    """Remove domains from the NextDNS denylist."""
-    _handle_remove_command(ctx, profile, "denylist", domains)
-
-
-@denylist.command("import")
-@click.argument("profile")
-@click.argument("source")
-@click.option("--inactive", is_flag=True, help="Add domains as inactive (not blocked)")
-@click.pass_context
-def denylist_import(ctx, profile, source, inactive):
-    """Import domains from a file or URL to the NextDNS denylist."""
-    _handle_import_command(ctx, profile, "denylist", source, inactive)
-
-
-@denylist.command("export")
-@click.argument("profile")
-@click.argument("output", type=click.Path(), default="-")
-@click.option("--active-only", is_flag=True, help="Export only active entries")
-@click.option("--inactive-only", is_flag=True, help="Export only inactive entries")
-@click.pass_context
-def denylist_export(ctx, profile, output, active_only, inactive_only):
-    """Export denylist domains to a file (or stdout with -)."""
-    _handle_export_command(ctx, profile, "denylist", output, active_only, inactive_only)
-
-
-@denylist.command("clear")
-@click.argument("profile")
-@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
-@click.pass_context
-def denylist_clear(ctx, profile, yes):
-    """Remove all domains from the denylist."""
-    _handle_clear_command(ctx, profile, "denylist", yes)
-
-
-@cli.group("allowlist")
-def allowlist():
-    """Manage the NextDNS allowlist."""
-
-
-@allowlist.command("list")
-@click.argument("profile")
-@click.option("--active-only", is_flag=True, help="Show only active entries")
-@click.option("--inactive-only", is_flag=True, help="Show only inactive entries")
-@click.pass_context
-def allowlist_list(ctx, profile, active_only, inactive_only):
-    """List all domains in the NextDNS allowlist."""
-    _handle_list_command(ctx, profile, "allowlist", active_only, inactive_only)
-
-
-@allowlist.command("add")
-@click.argument("profile")
-@click.argument("domains", nargs=-1)
-@click.option("--inactive", is_flag=True, help="Add domains as inactive (not allowed)")
-@click.pass_context
-def allowlist_add(ctx, profile, domains, inactive):
-    """Add domains to the NextDNS allowlist."""
-    _handle_add_command(ctx, profile, "allowlist", domains, inactive)
-
-
-@allowlist.command("remove")
-@click.argument("profile")
-@click.argument("domains", nargs=-1)
-@click.pass_context
-def allowlist_remove(ctx, profile, domains):
-    """Remove domains from the NextDNS allowlist."""
-    _handle_remove_command(ctx, profile, "allowlist", domains)
-
-
-@allowlist.command("import")
-@click.argument("profile")
-@click.argument("source")
-@click.option("--inactive", is_flag=True, help="Add domains as inactive (not allowed)")
-@click.pass_context
-def allowlist_import(ctx, profile, source, inactive):
-    """Import domains from a file or URL to the NextDNS allowlist."""
-    _handle_import_command(ctx, profile, "allowlist", source, inactive)
-
-
-@allowlist.command("export")
-@click.argument("profile")
-@click.argument("output", type=click.Path(), default="-")
-@click.option("--active-only", is_flag=True, help="Export only active entries")
-@click.option("--inactive-only", is_flag=True, help="Export only inactive entries")
-@click.pass_context
-def allowlist_export(ctx, profile, output, active_only, inactive_only):
-    """Export allowlist domains to a file (or stdout with -)."""
-    _handle_export_command(ctx, profile, "allowlist", output, active_only, inactive_only)
+def _make_domain_list_group(list_type: str, inactive_meaning: str) -> click.Group:
+    """
+    Build the command group for a domain list (denylist/allowlist).
 
+    Both lists support the same commands and only differ in the list type
+    passed to the shared handlers and in the wording of the help texts.
+    """
 
-@allowlist.command("clear")
-@click.argument("profile")
-@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
-@click.pass_context
-def allowlist_clear(ctx, profile, yes):
-    """Remove all domains from the allowlist."""
-    _handle_clear_command(ctx, profile, "allowlist", yes)
+    @click.group(list_type, help=f"Manage the NextDNS {list_type}.")
+    def group():
+        pass
+
+    @group.command("list", help=f"List all domains in the NextDNS {list_type}.")
+    @click.argument("profile")
+    @click.option("--active-only", is_flag=True, help="Show only active entries")
+    @click.option("--inactive-only", is_flag=True, help="Show only inactive entries")
+    @click.pass_context
+    def list_command(ctx, profile, active_only, inactive_only):
+        _handle_list_command(ctx, profile, list_type, active_only, inactive_only)
+
+    @group.command("add", help=f"Add domains to the NextDNS {list_type}.")
+    @click.argument("profile")
+    @click.argument("domains", nargs=-1)
+    @click.option("--inactive", is_flag=True, help=f"Add domains as inactive (not {inactive_meaning})")
+    @click.option("--bulk", is_flag=True, help="Add all domains in a single request instead of one per domain")
+    @click.option("--skip-existing", is_flag=True, help=f"Skip domains that are already in the {list_type}")
+    @click.pass_context
+    def add_command(ctx, profile, domains, inactive, bulk, skip_existing):
+        _handle_add_command(ctx, profile, list_type, domains, inactive, bulk, skip_existing)
+
+    @group.command("remove", help=f"Remove domains from the NextDNS {list_type}.")
+    @click.argument("profile")
+    @click.argument("domains", nargs=-1)
+    @click.option("--bulk", is_flag=True, help="Remove all domains in a single request instead of one per domain")
+    @click.option("--skip-missing", is_flag=True, help=f"Skip domains that are not in the {list_type}")
+    @click.pass_context
+    def remove_command(ctx, profile, domains, bulk, skip_missing):
+        _handle_remove_command(ctx, profile, list_type, domains, skip_missing, bulk)
+
+    @group.command("import", help=f"Import domains from a file or URL to the NextDNS {list_type}.")
+    @click.argument("profile")
+    @click.argument("source")
+    @click.option("--inactive", is_flag=True, help=f"Add domains as inactive (not {inactive_meaning})")
+    @click.option("--bulk", is_flag=True, help="Add all domains in a single request instead of one per domain")
+    @click.option("--skip-existing", is_flag=True, help=f"Skip domains that are already in the {list_type}")
+    @click.pass_context
+    def import_command(ctx, profile, source, inactive, bulk, skip_existing):
+        _handle_import_command(ctx, profile, list_type, source, inactive, bulk, skip_existing)
+
+    @group.command("export", help=f"Export {list_type} domains to a file (or stdout with -).")
+    @click.argument("profile")
+    @click.argument("output", type=click.Path(), default="-")
+    @click.option("--active-only", is_flag=True, help="Export only active entries")
+    @click.option("--inactive-only", is_flag=True, help="Export only inactive entries")
+    @click.pass_context
+    def export_command(ctx, profile, output, active_only, inactive_only):
+        _handle_export_command(ctx, profile, list_type, output, active_only, inactive_only)
+
+    @group.command("clear", help=f"Remove all domains from the {list_type}.")
+    @click.argument("profile")
+    @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
+    @click.option("--bulk", is_flag=True, help="Empty the list in a single request instead of one per domain")
+    @click.pass_context
+    def clear_command(ctx, profile, yes, bulk):
+        _handle_clear_command(ctx, profile, list_type, yes, bulk)
+
+    return group
+
+
+denylist = _make_domain_list_group("denylist", "blocked")
+allowlist = _make_domain_list_group("allowlist", "allowed")
+cli.add_command(denylist)
+cli.add_command(allowlist)
 
 
 if __name__ == "__main__":
@@ -11,14 +11,23 @@ def get_version():
         raise RuntimeError("Version not found")
 
 
+def get_long_description():
+    """Read the README used as the package's long description."""
+    with open("README.md", encoding="utf-8") as f:
+        return f.read()
+
+
 setup(
     name="nextdnsctl",
     version=get_version(),
     packages=find_packages(),
     install_requires=[
         "requests",
-        "click",
+        "click>=8.2",
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "nextdnsctl = nextdnsctl.nextdnsctl:cli",
@@ -27,7 +36,7 @@ setup(
     author="Daniel Meint",
     author_email="pilots-4-trilogy@icloud.com",
     description="A CLI tool for managing NextDNS profiles",
-    long_description=open("README.md").read(),
+    long_description=get_long_description(),
     long_description_content_type="text/markdown",
     license="MIT",
     url="https://github.com/danielmeint/nextdnsctl",
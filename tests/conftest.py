@@ -52,3 +52,11 @@ def mock_allowlist_response():
 def mock_empty_list_response():
     """Mock response for an empty list."""
     return {"data": []}
+
+
+@pytest.fixture(autouse=True)
+def isolated_profiles_cache(tmp_path, monkeypatch):
+    """Keeps the on-disk profiles cache out of the user's config directory."""
+    cache_file = tmp_path / "profiles_cache.json"
+    monkeypatch.setattr("nextdnsctl.config.PROFILES_CACHE_FILE", str(cache_file))
+    return cache_file
@@ -1,9 +1,11 @@
 """Tests for API error handling and resilience."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
-from nextdnsctl.api import APIClient, RateLimitStillActiveError
+from nextdnsctl.api import MAX_RETRY_DELAY, APIClient, APIError, RateLimitStillActiveError, _parse_retry_after
 
 
 class TestRetryOn500:
@@ -42,6 +44,8 @@ class TestRetryOn500:
 
         mock_response = Mock()
         mock_response.status_code = 500
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = b'{"errors": [{"detail": "Internal error"}]}'
         mock_response.json.return_value = {"errors": [{"detail": "Internal error"}]}
 
         with patch("requests.Session") as MockSession:
@@ -123,6 +127,46 @@ class TestRateLimiting:
                 client.call("GET", "test")
 
 
+class TestErrorResponses:
+    """Tests for non-retryable error responses."""
+
+    def test_raises_api_error_with_detail(self):
+        """Should raise APIError carrying the status code and API detail."""
+        import requests_mock as rm
+
+        from nextdnsctl.api import API_BASE
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}test", status_code=404, json={"errors": [{"detail": "Not found"}]})
+
+            client = APIClient("fake-key")
+            with pytest.raises(APIError, match="Not found") as exc_info:
+                client.call("GET", "test")
+
+            assert exc_info.value.status_code == 404
+            assert exc_info.value.detail == "Not found"
+            client.close()
+
+    def test_non_json_error_body_is_not_decoded(self):
+        """Should not try to decode an error body that isn't JSON."""
+        mock_response = Mock()
+        mock_response.status_code = 403
+        mock_response.headers = {"Content-Type": "text/html"}
+        mock_response.content = b"<html>Forbidden</html>"
+
+        with patch("requests.Session") as MockSession:
+            mock_session = Mock()
+            mock_session.request.return_value = mock_response
+            MockSession.return_value = mock_session
+
+            client = APIClient("fake-key")
+            with pytest.raises(APIError, match="non-JSON response") as exc_info:
+                client.call("GET", "test")
+
+            assert exc_info.value.status_code == 403
+            mock_response.json.assert_not_called()
+
+
 class TestNetworkErrors:
     """Tests for network error handling."""
 
@@ -225,3 +269,151 @@ class TestSessionReuse:
             assert MockSession.call_count == 1
             # But request should be called 3 times on the same session
             assert mock_session.request.call_count == 3
+
+    def test_connection_pool_sized_for_concurrency(self):
+        """Should mount an HTTPS adapter large enough for all parallel workers."""
+        client = APIClient("fake-key", pool_maxsize=15)
+
+        adapter = client.session.get_adapter("https://api.nextdns.io/")
+        assert adapter._pool_maxsize == 15
+        client.close()
+
+
+class TestBackoff:
+    """Tests for backoff timing and Retry-After parsing."""
+
+    def test_backoff_is_capped(self, mocker):
+        """Exponential backoff should never exceed MAX_RETRY_DELAY."""
+        mock_sleep = mocker.patch("nextdnsctl.api.time.sleep")
+
+        mock_response = Mock()
+        mock_response.status_code = 503
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.content = b'{"errors": [{"detail": "Unavailable"}]}'
+        mock_response.json.return_value = {"errors": [{"detail": "Unavailable"}]}
+
+        with patch("requests.Session") as MockSession:
+            mock_session = Mock()
+            mock_session.request.return_value = mock_response
+            MockSession.return_value = mock_session
+
+            client = APIClient("fake-key", retries=4, delay=10)
+            with pytest.raises(Exception, match="Unavailable"):
+                client.call("GET", "test")
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == [10, 20, MAX_RETRY_DELAY, MAX_RETRY_DELAY]
+
+    def test_retry_after_http_date(self, mocker):
+        """Should accept Retry-After given as an HTTP date."""
+        mocker.patch("nextdnsctl.api.time.time", return_value=1445412480.0)
+
+        # 2015-10-21 07:28:00 GMT is the epoch above
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT") == 10
+
+    def test_invalid_retry_after_falls_back_to_default_pause(self, mocker):
+        """An unparseable Retry-After should be treated as missing."""
+        mock_sleep = mocker.patch("nextdnsctl.api.time.sleep")
+
+        mock_rate_limited = Mock()
+        mock_rate_limited.status_code = 429
+        mock_rate_limited.headers = {"Retry-After": "soon"}
+
+        mock_ok = Mock()
+        mock_ok.status_code = 200
+        mock_ok.json.return_value = {"data": []}
+
+        with patch("requests.Session") as MockSession:
+            mock_session = Mock()
+            mock_session.request.side_effect = [mock_rate_limited, mock_ok]
+            MockSession.return_value = mock_session
+
+            client = APIClient("fake-key", retries=1)
+            client.call("GET", "test")
+
+            mock_sleep.assert_called_with(60)
+
+
+class TestFallbackClient:
+    """Tests for the module-level client used by the function wrappers."""
+
+    def test_fallback_client_is_reused(self, mocker):
+        """Should load the API key and build a session only once."""
+        from nextdnsctl import api
+
+        api.clear_client()
+        mock_load = mocker.patch("nextdnsctl.config.load_api_key", return_value="fake-key")
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": []}
+
+        with patch("requests.Session") as MockSession:
+            mock_session = Mock()
+            mock_session.request.return_value = mock_response
+            MockSession.return_value = mock_session
+
+            api.api_call("GET", "profiles")
+            api.api_call("GET", "profiles")
+
+            assert mock_load.call_count == 1
+            assert MockSession.call_count == 1
+            assert mock_session.request.call_count == 2
+
+        api.clear_client()
+
+
+class TestConditionalRequests:
+    """Tests for ETag revalidation of GET requests."""
+
+    def test_revalidates_with_etag_and_reuses_body_on_304(self):
+        """Should send If-None-Match and return the cached body on 304."""
+        import requests_mock as rm
+
+        from nextdnsctl.api import API_BASE
+
+        with rm.Mocker() as m:
+            adapter = m.get(
+                f"{API_BASE}profiles",
+                [
+                    {"json": {"data": [{"id": "abc1234"}]}, "headers": {"ETag": '"v1"'}},
+                    {"status_code": 304},
+                ],
+            )
+
+            client = APIClient("fake-key")
+            first = client.get_profiles()
+            second = client.get_profiles()
+
+            assert first == second == [{"id": "abc1234"}]
+            assert "If-None-Match" not in adapter.request_history[0].headers
+            assert adapter.request_history[1].headers["If-None-Match"] == '"v1"'
+            client.close()
+
+
+class TestRequestEncoding:
+    """Tests for request payload serialization."""
+
+    def test_payload_is_encoded_once_across_retries(self, mocker):
+        """Should send the same pre-encoded JSON body on every attempt."""
+        mocker.patch("nextdnsctl.api.time.sleep")
+
+        mock_response_fail = Mock()
+        mock_response_fail.status_code = 500
+
+        mock_response_ok = Mock()
+        mock_response_ok.status_code = 204
+
+        with patch("requests.Session") as MockSession:
+            mock_session = Mock()
+            mock_session.request.side_effect = [mock_response_fail, mock_response_ok]
+            MockSession.return_value = mock_session
+
+            client = APIClient("fake-key", retries=1)
+            client.call("POST", "test", data={"id": "bad.com", "active": True})
+
+            bodies = [call.kwargs["data"] for call in mock_session.request.call_args_list]
+            assert bodies[0] is bodies[1]
+            assert json.loads(bodies[0]) == {"id": "bad.com", "active": True}
+            headers = mock_session.request.call_args.kwargs["headers"]
+            assert headers["Content-Type"] == "application/json"
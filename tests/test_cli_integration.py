@@ -1,5 +1,7 @@
 """Integration tests for CLI commands with mocked API."""
 
+import os
+
 import requests_mock as rm
 
 from nextdnsctl.nextdnsctl import cli
@@ -43,6 +45,41 @@ class TestDenylistCommands:
             assert "bad-domain.com" in result.output
             assert "inactive-domain.com (inactive)" in result.output
 
+    def test_denylist_list_inactive_only(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+
+            result = runner.invoke(cli, ["denylist", "list", "abc1234", "--inactive-only"])
+
+            assert result.exit_code == 0
+            assert "inactive-domain.com (inactive)" in result.output
+            assert "bad-domain.com" not in result.output
+
+    def test_denylist_export_to_file(
+        self, runner, mock_api_key, mock_profiles_response, mock_denylist_response, tmp_path
+    ):
+        output_file = tmp_path / "export.txt"
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+
+            result = runner.invoke(cli, ["denylist", "export", "abc1234", str(output_file), "--active-only"])
+
+            assert result.exit_code == 0
+            assert output_file.read_text() == "bad-domain.com\nanother-bad.net\n"
+            assert "Exported 2 domains" in result.output
+
+    def test_denylist_export_to_stdout(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+
+            result = runner.invoke(cli, ["denylist", "export", "abc1234"])
+
+            assert result.exit_code == 0
+            assert result.stdout == "bad-domain.com\ninactive-domain.com\nanother-bad.net\n"
+
     def test_denylist_list_by_name(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
         """Profile resolution by name should work."""
         with rm.Mocker() as m:
@@ -92,6 +129,22 @@ class TestDenylistCommands:
             assert result.exit_code == 0
             assert adapter.last_request.json() == {"id": "bad.com", "active": False}
 
+    def test_denylist_add_bulk(self, runner, mock_api_key, mock_profiles_response, mock_empty_list_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_empty_list_response)
+            post_adapter = m.post(f"{API_BASE}profiles/abc1234/denylist", status_code=500)
+            put_adapter = m.put(f"{API_BASE}profiles/abc1234/denylist", status_code=204)
+
+            result = runner.invoke(cli, ["denylist", "add", "abc1234", "bad.com", "evil.com", "--bulk"])
+
+            assert result.exit_code == 0
+            assert not post_adapter.called
+            assert put_adapter.last_request.json() == [
+                {"id": "bad.com", "active": True},
+                {"id": "evil.com", "active": True},
+            ]
+
     def test_denylist_remove(self, runner, mock_api_key, mock_profiles_response):
         with rm.Mocker() as m:
             m.get(f"{API_BASE}profiles", json=mock_profiles_response)
@@ -102,6 +155,138 @@ class TestDenylistCommands:
             assert result.exit_code == 0
             assert adapter.called
 
+    def test_denylist_remove_bulk(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            delete_adapter = m.delete(f"{API_BASE}profiles/abc1234/denylist/bad-domain.com", status_code=500)
+            put_adapter = m.put(f"{API_BASE}profiles/abc1234/denylist", status_code=204)
+
+            result = runner.invoke(cli, ["denylist", "remove", "abc1234", "bad-domain.com", "missing.com", "--bulk"])
+
+            assert result.exit_code == 0
+            assert not delete_adapter.called
+            assert put_adapter.last_request.json() == [
+                {"id": "inactive-domain.com", "active": False},
+                {"id": "another-bad.net", "active": True},
+            ]
+            assert "Removed 1 domain(s)" in result.output
+            assert "Skipping 1 domain(s) not in the denylist" in result.output
+
+    def test_denylist_clear_bulk(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            delete_adapter = m.delete(rm.ANY, status_code=204)
+            put_adapter = m.put(f"{API_BASE}profiles/abc1234/denylist", status_code=204)
+
+            result = runner.invoke(cli, ["denylist", "clear", "abc1234", "--yes", "--bulk"])
+
+            assert result.exit_code == 0
+            assert put_adapter.last_request.json() == []
+            assert not delete_adapter.called
+            assert "Removed 3 domain(s) in a single request" in result.output
+
+    def test_denylist_clear_bulk_falls_back(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            m.put(f"{API_BASE}profiles/abc1234/denylist", status_code=405)
+            delete_adapter = m.delete(rm.ANY, status_code=204)
+
+            result = runner.invoke(cli, ["--concurrency", "1", "denylist", "clear", "abc1234", "--yes", "--bulk"])
+
+            assert result.exit_code == 0
+            assert delete_adapter.call_count == 3
+            assert "Bulk clear not supported" in result.output
+
+    def test_denylist_add_skip_existing(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            adapter = m.post(f"{API_BASE}profiles/abc1234/denylist", json={"id": "new.com", "active": True})
+
+            result = runner.invoke(
+                cli,
+                ["--concurrency", "1", "denylist", "add", "abc1234", "bad-domain.com", "new.com", "--skip-existing"],
+            )
+
+            assert result.exit_code == 0
+            assert adapter.call_count == 1
+            assert adapter.last_request.json() == {"id": "new.com", "active": True}
+
+    def test_denylist_remove_bulk_normalizes_input(
+        self, runner, mock_api_key, mock_profiles_response, mock_denylist_response
+    ):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            put_adapter = m.put(f"{API_BASE}profiles/abc1234/denylist", status_code=204)
+
+            result = runner.invoke(cli, ["denylist", "remove", "abc1234", "BAD-Domain.com", "--bulk"])
+
+            assert result.exit_code == 0
+            assert put_adapter.last_request.json() == [
+                {"id": "inactive-domain.com", "active": False},
+                {"id": "another-bad.net", "active": True},
+            ]
+            assert "Removed 1 domain(s)" in result.output
+
+    def test_denylist_remove_skip_missing_normalizes_input(
+        self, runner, mock_api_key, mock_profiles_response, mock_denylist_response
+    ):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            adapter = m.delete(f"{API_BASE}profiles/abc1234/denylist/bad-domain.com", status_code=204)
+
+            result = runner.invoke(
+                cli, ["--concurrency", "1", "denylist", "remove", "abc1234", "BAD-Domain.com", "--skip-missing"]
+            )
+
+            assert result.exit_code == 0
+            assert adapter.called
+            assert "Skipping" not in result.output
+
+    def test_denylist_remove_keeps_entries_that_fail_validation(self, runner, mock_api_key, mock_profiles_response):
+        """Entries the domain regex rejects (e.g. punycode TLDs) should still be removable."""
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            adapter = m.delete(f"{API_BASE}profiles/abc1234/denylist/xn--e1afmkfd.xn--p1ai", status_code=204)
+
+            result = runner.invoke(
+                cli, ["--concurrency", "1", "denylist", "remove", "abc1234", "XN--E1AFMKFD.xn--p1ai."]
+            )
+
+            assert result.exit_code == 0
+            assert adapter.called
+
+    def test_denylist_remove_skip_missing(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            present = m.delete(f"{API_BASE}profiles/abc1234/denylist/bad-domain.com", status_code=204)
+            missing = m.delete(f"{API_BASE}profiles/abc1234/denylist/unknown.com", status_code=404)
+
+            result = runner.invoke(
+                cli,
+                [
+                    "--concurrency",
+                    "1",
+                    "denylist",
+                    "remove",
+                    "abc1234",
+                    "bad-domain.com",
+                    "unknown.com",
+                    "--skip-missing",
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert present.called
+            assert not missing.called
+            assert "Skipping 1 domain(s) not in the denylist" in result.output
+
 
 class TestDryRun:
     """Tests for --dry-run mode."""
@@ -142,6 +327,100 @@ class TestProfileResolution:
             assert result.exit_code == 0
             assert "bad-domain.com" in result.output
 
+    def test_duplicate_names_resolve_to_first_profile(self, runner, mock_api_key, mock_denylist_response):
+        profiles = {"data": [{"id": "abc1234", "name": "Home"}, {"id": "xyz9876", "name": "home"}]}
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=profiles)
+            adapter = m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+
+            result = runner.invoke(cli, ["denylist", "list", "HOME"])
+
+            assert result.exit_code == 0
+            assert adapter.called
+
+    def test_profiles_cached_between_invocations(
+        self, runner, mock_api_key, mock_profiles_response, mock_denylist_response
+    ):
+        with rm.Mocker() as m:
+            profiles_adapter = m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+
+            runner.invoke(cli, ["denylist", "list", "My Profile"])
+            result = runner.invoke(cli, ["denylist", "list", "abc1234"])
+
+            assert result.exit_code == 0
+            assert profiles_adapter.call_count == 1
+
+    def test_cached_name_match_is_revalidated(self, runner, mock_api_key, mock_denylist_response):
+        """A name that moved to another profile must not resolve to the cached ID."""
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json={"data": [{"id": "old1111", "name": "Kids"}]})
+            runner.invoke(cli, ["profile-list"])
+
+            m.get(
+                f"{API_BASE}profiles",
+                json={"data": [{"id": "old1111", "name": "Kids (old)"}, {"id": "new2222", "name": "Kids"}]},
+            )
+            old_adapter = m.get(f"{API_BASE}profiles/old1111/denylist", json=mock_denylist_response)
+            new_adapter = m.get(f"{API_BASE}profiles/new2222/denylist", json=mock_denylist_response)
+
+            result = runner.invoke(cli, ["denylist", "list", "Kids"])
+
+            assert result.exit_code == 0
+            assert new_adapter.called
+            assert not old_adapter.called
+
+    def test_cache_miss_refetches_profiles(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response):
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            runner.invoke(cli, ["profile-list"])
+
+            new_profile = {"id": "new5678", "name": "New Profile"}
+            profiles_adapter = m.get(
+                f"{API_BASE}profiles", json={"data": mock_profiles_response["data"] + [new_profile]}
+            )
+            m.get(f"{API_BASE}profiles/new5678/denylist", json=mock_denylist_response)
+
+            result = runner.invoke(cli, ["denylist", "list", "New Profile"])
+
+            assert result.exit_code == 0
+            assert profiles_adapter.call_count == 1
+
+    def test_expired_cache_is_revalidated_with_etag(
+        self, runner, mock_api_key, mock_profiles_response, mock_denylist_response, isolated_profiles_cache
+    ):
+        with rm.Mocker() as m:
+            profiles_adapter = m.get(
+                f"{API_BASE}profiles",
+                [
+                    {"json": mock_profiles_response, "headers": {"ETag": '"v1"'}},
+                    {"status_code": 304},
+                ],
+            )
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+
+            runner.invoke(cli, ["profile-list"])
+            old = os.path.getmtime(isolated_profiles_cache) - 600
+            os.utime(isolated_profiles_cache, (old, old))
+            result = runner.invoke(cli, ["denylist", "list", "My Profile"])
+
+            assert result.exit_code == 0
+            assert profiles_adapter.call_count == 2
+            assert profiles_adapter.last_request.headers["If-None-Match"] == '"v1"'
+
+    def test_no_profile_cache_always_fetches(
+        self, runner, mock_api_key, mock_profiles_response, mock_denylist_response, isolated_profiles_cache
+    ):
+        with rm.Mocker() as m:
+            profiles_adapter = m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+
+            runner.invoke(cli, ["--no-profile-cache", "denylist", "list", "abc1234"])
+            runner.invoke(cli, ["--no-profile-cache", "denylist", "list", "abc1234"])
+
+            assert profiles_adapter.call_count == 2
+            assert not isolated_profiles_cache.exists()
+
 
 class TestAuthCommand:
     """Tests for auth command."""
@@ -248,3 +527,66 @@ class TestImportCommand:
             assert "bad1.com" in result.output
             assert "bad2.com" in result.output
             assert not adapter.called
+
+    def test_import_reports_duplicates(self, runner, mock_api_key, mock_profiles_response, tmp_path):
+        """Duplicate domains should be sent once and reported."""
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("dup.com\n0.0.0.0 dup.com\nDUP.com\nother.com\n")
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            adapter = m.post(f"{API_BASE}profiles/abc1234/denylist", json={})
+
+            result = runner.invoke(cli, ["--concurrency", "1", "denylist", "import", "abc1234", str(domains_file)])
+
+            assert result.exit_code == 0
+            assert adapter.call_count == 2
+            assert "Skipped 2 duplicate domain(s)" in result.output
+
+    def test_import_bulk_sends_single_put(
+        self, runner, mock_api_key, mock_profiles_response, mock_denylist_response, tmp_path
+    ):
+        """Bulk import should merge with the current list and PUT it once."""
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("bad-domain.com\nnew1.com\nnew2.com\n")
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            post_adapter = m.post(f"{API_BASE}profiles/abc1234/denylist", status_code=500)
+            put_adapter = m.put(f"{API_BASE}profiles/abc1234/denylist", status_code=204)
+
+            result = runner.invoke(cli, ["denylist", "import", "abc1234", str(domains_file), "--bulk"])
+
+            assert result.exit_code == 0
+            assert not post_adapter.called
+            assert put_adapter.call_count == 1
+            assert put_adapter.last_request.json() == [
+                {"id": "bad-domain.com", "active": True},
+                {"id": "inactive-domain.com", "active": False},
+                {"id": "another-bad.net", "active": True},
+                {"id": "new1.com", "active": True},
+                {"id": "new2.com", "active": True},
+            ]
+            assert "Added 2 domain(s)" in result.output
+            assert "Skipping 1 domain(s) already in the denylist" in result.output
+
+    def test_import_skip_existing(self, runner, mock_api_key, mock_profiles_response, mock_denylist_response, tmp_path):
+        """--skip-existing should only POST domains not already on the list."""
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("bad-domain.com\nanother-bad.net\nnew1.com\n")
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.get(f"{API_BASE}profiles/abc1234/denylist", json=mock_denylist_response)
+            adapter = m.post(f"{API_BASE}profiles/abc1234/denylist", json={"id": "new1.com", "active": True})
+
+            result = runner.invoke(
+                cli,
+                ["--concurrency", "1", "denylist", "import", "abc1234", str(domains_file), "--skip-existing"],
+            )
+
+            assert result.exit_code == 0
+            assert adapter.call_count == 1
+            assert adapter.last_request.json() == {"id": "new1.com", "active": True}
+            assert "Skipping 2 domain(s) already in the denylist" in result.output
@@ -1,5 +1,6 @@
 """Tests for concurrency/parallelism validation."""
 
+import click
 import requests_mock as rm
 
 from nextdnsctl.nextdnsctl import cli
@@ -82,6 +83,159 @@ class TestConcurrency:
             # Should NOT show parallel summary format
             assert "Completed:" not in result.output
 
+    def test_single_domain_runs_inline(self, runner, mock_api_key, mock_profiles_response):
+        """A single domain should skip the worker pool and report like sequential mode."""
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.post(
+                f"{API_BASE}profiles/abc1234/denylist",
+                json={"id": "bad.com", "active": True},
+            )
+
+            result = runner.invoke(cli, ["--concurrency", "5", "denylist", "add", "abc1234", "bad.com"])
+
+            assert result.exit_code == 0
+            assert "Added bad.com" in result.output
+            assert "Completed:" not in result.output
+
+    def test_rate_limit_stops_submitting_new_work(self, runner, mock_api_key, mock_profiles_response, tmp_path):
+        """Only the in-flight window should be attempted once rate limiting persists."""
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("".join(f"d{i}.com\n" for i in range(20)))
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            adapter = m.post(f"{API_BASE}profiles/abc1234/denylist", status_code=429)
+
+            result = runner.invoke(
+                cli,
+                [
+                    "--retry-attempts",
+                    "0",
+                    "--concurrency",
+                    "2",
+                    "denylist",
+                    "import",
+                    "abc1234",
+                    str(domains_file),
+                ],
+            )
+
+            assert result.exit_code == 1
+            # Window is 2 * concurrency; nothing is submitted after the abort
+            assert adapter.call_count == 4
+            assert "Failed: 4, Skipped: 16" in result.output
+            assert "Operation aborted due to persistent rate limiting" in result.output
+
+    def test_sequential_output_is_batched_when_not_a_tty(
+        self, runner, mocker, mock_api_key, mock_profiles_response, tmp_path
+    ):
+        """Redirected sequential output should be written in batches, not per domain."""
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("".join(f"d{i}.com\n" for i in range(150)))
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.post(
+                f"{API_BASE}profiles/abc1234/denylist",
+                json={"id": "test", "active": True},
+            )
+            echo_spy = mocker.spy(click, "echo")
+
+            result = runner.invoke(
+                cli,
+                ["--concurrency", "1", "denylist", "import", "abc1234", str(domains_file)],
+            )
+
+            assert result.exit_code == 0
+            assert result.output.count("Added d") == 150
+            # 150 result lines are flushed as one batch of 100 and one of 50
+            result_writes = [c for c in echo_spy.call_args_list if c.args and "Added d" in str(c.args[0])]
+            assert len(result_writes) == 2
+
+    def test_buffered_output_is_flushed_on_interrupt(self, runner, mock_api_key, mock_profiles_response, tmp_path):
+        """Results already applied should still be written if the run is interrupted."""
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("d1.com\nd2.com\nd3.com\n")
+
+        def add_domain(request, context):
+            if request.json()["id"] == "d3.com":
+                raise KeyboardInterrupt
+            return {"id": request.json()["id"], "active": True}
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.post(f"{API_BASE}profiles/abc1234/denylist", json=add_domain)
+
+            result = runner.invoke(
+                cli,
+                ["--concurrency", "1", "denylist", "import", "abc1234", str(domains_file)],
+            )
+
+            assert result.exit_code != 0
+            assert "Added d1.com" in result.output
+            assert "Added d2.com" in result.output
+
+    def test_progress_bar_reaches_total(self, runner, mocker, mock_api_key, mock_profiles_response, tmp_path):
+        """Steps below update_min_steps should still be drawn before the bar finishes."""
+        from click._termui_impl import ProgressBar
+
+        # 401 domains redraw every 2 steps, leaving one step below the threshold
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("".join(f"d{i}.com\n" for i in range(401)))
+
+        positions = []
+        render_finish = ProgressBar.render_finish
+
+        def record_position(bar):
+            positions.append(bar.pos)
+            render_finish(bar)
+
+        mocker.patch.object(ProgressBar, "render_finish", record_position)
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            m.post(f"{API_BASE}profiles/abc1234/denylist", json={"id": "test", "active": True})
+
+            result = runner.invoke(cli, ["--concurrency", "4", "denylist", "import", "abc1234", str(domains_file)])
+
+            assert result.exit_code == 0
+            assert positions == [401]
+
+    def test_quiet_suppresses_per_domain_output(self, runner, mock_api_key, mock_profiles_response, tmp_path):
+        """With --quiet, sequential mode should not echo each processed domain."""
+        domains_file = tmp_path / "domains.txt"
+        domains_file.write_text("d1.com\nd2.com\n")
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+            adapter = m.post(
+                f"{API_BASE}profiles/abc1234/denylist",
+                json={"id": "test", "active": True},
+            )
+
+            result = runner.invoke(
+                cli,
+                ["--quiet", "--concurrency", "1", "denylist", "import", "abc1234", str(domains_file)],
+            )
+
+            assert result.exit_code == 0
+            assert adapter.call_count == 2
+            assert "Added d1.com" not in result.output
+
+    def test_connection_pool_matches_concurrency(self, runner, mock_api_key, mock_profiles_response):
+        """The API session pool should be sized to the number of workers."""
+        from nextdnsctl import api
+
+        with rm.Mocker() as m:
+            m.get(f"{API_BASE}profiles", json=mock_profiles_response)
+
+            result = runner.invoke(cli, ["--concurrency", "7", "profile-list"])
+
+        assert result.exit_code == 0
+        assert api._client is not None
+        assert api._client.session.get_adapter(API_BASE)._pool_maxsize == 7
+
     def test_concurrency_respects_max_limit(self, runner):
         """Concurrency option should reject values > 20."""
         result = runner.invoke(cli, ["--concurrency", "21", "profile-list"])
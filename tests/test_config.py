@@ -5,7 +5,13 @@ import os
 import stat
 import pytest
 
-from nextdnsctl.config import save_api_key, load_api_key, ENV_VAR_NAME
+from nextdnsctl.config import (
+    save_api_key,
+    load_api_key,
+    load_cached_profiles,
+    save_cached_profiles,
+    ENV_VAR_NAME,
+)
 
 
 class TestSaveApiKey:
@@ -97,3 +103,36 @@ class TestLoadApiKey:
 
         with pytest.raises(ValueError, match="Invalid config file"):
             load_api_key()
+
+
+class TestProfilesCache:
+    """Tests for the on-disk profiles cache."""
+
+    PROFILES = [{"id": "abc1234", "name": "My Profile"}]
+
+    def test_round_trip(self):
+        """Should return the saved profiles for the same API key."""
+        save_cached_profiles("key-1", self.PROFILES)
+        assert load_cached_profiles("key-1") == self.PROFILES
+
+    def test_does_not_store_api_key(self, isolated_profiles_cache):
+        """Should identify the API key without writing it to disk."""
+        save_cached_profiles("secret-key", self.PROFILES)
+        assert "secret-key" not in isolated_profiles_cache.read_text()
+
+    def test_ignores_other_api_key(self):
+        """Should not return profiles cached for a different API key."""
+        save_cached_profiles("key-1", self.PROFILES)
+        assert load_cached_profiles("key-2") is None
+
+    def test_expires_after_ttl(self, isolated_profiles_cache):
+        """Should ignore a cache older than the TTL."""
+        save_cached_profiles("key-1", self.PROFILES)
+        old = os.path.getmtime(isolated_profiles_cache) - 600
+        os.utime(isolated_profiles_cache, (old, old))
+        assert load_cached_profiles("key-1", ttl=300) is None
+
+    def test_ignores_corrupt_cache(self, isolated_profiles_cache):
+        """Should treat an unreadable cache as a miss."""
+        isolated_profiles_cache.write_text("{not json")
+        assert load_cached_profiles("key-1") is None
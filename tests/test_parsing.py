@@ -1,6 +1,13 @@
 """Unit tests for domain parsing logic."""
 
-from nextdnsctl.nextdnsctl import _parse_domain_line
+import requests_mock as rm
+
+from nextdnsctl.nextdnsctl import (
+    _get_download_session,
+    _parse_domain_line,
+    _parse_domain_names,
+    read_domains_from_source,
+)
 
 
 class TestParseDomainLine:
@@ -39,3 +46,43 @@ class TestParseDomainLine:
     def test_complex_inline_comment(self):
         # Only the first # should trigger comment stripping
         assert _parse_domain_line("domain.com # bad site # really bad") == "domain.com"
+
+    def test_hosts_file_entry(self):
+        assert _parse_domain_line("0.0.0.0 ads.example.com") == "ads.example.com"
+
+    def test_hosts_file_entry_with_tab_and_comment(self):
+        assert _parse_domain_line("127.0.0.1\tads.example.com # tracker") == "ads.example.com"
+
+    def test_hosts_file_ipv6_entry(self):
+        assert _parse_domain_line("::1 ads.example.com") == "ads.example.com"
+
+    def test_hosts_file_entry_with_several_names(self):
+        assert _parse_domain_names("0.0.0.0 a.example.com b.example.com # ads") == ["a.example.com", "b.example.com"]
+
+
+class TestReadDomainsFromSource:
+    """Tests for read_domains_from_source function."""
+
+    def test_reads_file(self, tmp_path):
+        source = tmp_path / "domains.txt"
+        source.write_text("# header\nbad1.com\n\nbad2.com # why\n")
+
+        assert list(read_domains_from_source(str(source))) == ["bad1.com", "bad2.com"]
+
+    def test_reads_every_name_on_hosts_lines(self, tmp_path):
+        source = tmp_path / "hosts"
+        source.write_text("0.0.0.0 a.com b.com\n127.0.0.1 c.com\n")
+
+        assert list(read_domains_from_source(str(source))) == ["a.com", "b.com", "c.com"]
+
+    def test_streams_url(self):
+        with rm.Mocker() as m:
+            m.get("https://lists.example.org/block.txt", text="# header\nbad1.com\nbad2.com\n")
+
+            domains = list(read_domains_from_source("https://lists.example.org/block.txt"))
+
+        assert domains == ["bad1.com", "bad2.com"]
+
+    def test_url_downloads_share_a_session_without_api_key(self, mock_api_key):
+        assert _get_download_session() is _get_download_session()
+        assert "X-Api-Key" not in _get_download_session().headers
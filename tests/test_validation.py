@@ -3,6 +3,7 @@
 import pytest
 
 from nextdnsctl.api import validate_domain, InvalidDomainError
+from nextdnsctl.nextdnsctl import _validate_domains
 
 
 class TestDomainValidation:
@@ -151,3 +152,23 @@ class TestDomainValidation:
             validate_domain("http://")
         with pytest.raises(InvalidDomainError, match="cannot be empty"):
             validate_domain("https://")
+
+    def test_strips_trailing_root_dot(self):
+        """Should accept fully qualified names with a trailing dot."""
+        assert validate_domain("example.com.") == "example.com"
+
+
+class TestValidateDomains:
+    """Tests for validating batches of domains."""
+
+    def test_deduplicates_after_normalization(self):
+        """Should drop duplicates that only differ in case or formatting."""
+        valid, invalid = _validate_domains(["Example.com", "bad.net", "example.com.", "https://bad.net/x"])
+        assert valid == ["example.com", "bad.net"]
+        assert invalid == []
+
+    def test_collects_invalid_domains(self):
+        """Should report invalid domains without dropping valid ones."""
+        valid, invalid = _validate_domains(["good.com", "not a domain"])
+        assert valid == ["good.com"]
+        assert len(invalid) == 1